@@ -1,14 +1,18 @@
-from fastapi import FastAPI, HTTPException, Path
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, field_validator, model_validator, computed_field, Field
+from fastapi import FastAPI, HTTPException, Path, Query
+from fastapi.responses import Response
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, StringConstraints, field_validator, model_validator, computed_field, Field
 from enum import Enum
-from typing import List, Optional
-from decimal import Decimal
-import re
+from typing import Annotated, Any, Callable, List, Optional
+import os
 from itertools import count
+from collections import defaultdict
 import uvicorn
+import orjson
 from datetime import datetime
 
+NameStr = Annotated[str, StringConstraints(min_length=3, max_length=100, pattern=r'^[a-zA-Z ]+$')]
+
 class FoodCategory(str, Enum):
     APPETIZER = "appetizer"
     MAIN_COURSE = "main_course"
@@ -16,66 +20,79 @@ class FoodCategory(str, Enum):
     BEVERAGE = "beverage"
     SALAD = "salad"
 
+def _check_not_spicy(item: 'FoodItemBase') -> None:
+    if item.is_spicy:
+        raise ValueError('Desserts and beverages cannot be marked as spicy')
+
+def _check_beverage(item: 'FoodItemBase') -> None:
+    _check_not_spicy(item)
+    if item.preparation_time > 10:
+        raise ValueError('Preparation time for beverages should be ≤ 10 minutes')
+
+_CATEGORY_RULES: dict[FoodCategory, Callable[['FoodItemBase'], None]] = {
+    FoodCategory.DESSERT: _check_not_spicy,
+    FoodCategory.BEVERAGE: _check_beverage,
+}
+
 class FoodItemBase(BaseModel):
-    name: str = Field(..., min_length=3, max_length=100)
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    name: NameStr
     description: str = Field(..., min_length=10, max_length=500)
     category: FoodCategory
-    price: Decimal = Field(..., gt=0)
+    price_cents: int = Field(..., ge=100, le=10000)
     is_available: bool = True
     preparation_time: int = Field(..., ge=1, le=120)
-    ingredients: List[str] = Field(..., min_length=1)
+    ingredients: List[Any] = Field(..., min_length=1, json_schema_extra={'items': {'type': 'string'}})
     calories: Optional[int] = Field(None, gt=0)
     is_vegetarian: bool = False
     is_spicy: bool = False
 
-    @field_validator('name')
+    @field_validator('ingredients')
     @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not re.match(r'^[a-zA-Z ]+$', v):
-            raise ValueError('Name should contain only letters and spaces')
-        return v
-
-    @field_validator('price')
-    @classmethod
-    def validate_price(cls, v: Decimal) -> Decimal:
-        if v.quantize(Decimal('0.01')) != v:
-            raise ValueError('Price must have at most 2 decimal places')
-        if v < Decimal('1.00') or v > Decimal('100.00'):
-            raise ValueError('Price must be between $1.00 and $100.00')
+    def validate_ingredients(cls, v: List[Any]) -> List[Any]:
+        if not all(isinstance(x, str) for x in v):
+            raise ValueError('Ingredients must be strings')
         return v
 
     @model_validator(mode='after')
     def custom_validations(self) -> 'FoodItemBase':
-        if self.category in [FoodCategory.DESSERT, FoodCategory.BEVERAGE] and self.is_spicy:
-            raise ValueError('Desserts and beverages cannot be marked as spicy')
+        rule = _CATEGORY_RULES.get(self.category)
+        if rule is not None:
+            rule(self)
         if self.calories is not None and self.is_vegetarian and self.calories >= 800:
             raise ValueError('Vegetarian items should have calories < 800')
-        if self.category == FoodCategory.BEVERAGE and self.preparation_time > 10:
-            raise ValueError('Preparation time for beverages should be ≤ 10 minutes')
         return self
 
 class FoodItem(FoodItemBase):
-    id: int = Field(default_factory=lambda: next(id_generator))
+    id: int
+    price: str = ""
+    price_category: str = ""
+    dietary_info: List[str] = Field(default_factory=list)
 
-    @computed_field
-    @property
-    def price_category(self) -> str:
-        if self.price < Decimal('10'):
-            return "Budget"
-        elif self.price <= Decimal('25'):
-            return "Mid-range"
+    @model_validator(mode='after')
+    def set_display_fields(self) -> 'FoodItem':
+        if self.price_cents < 1000:
+            price_category = "Budget"
+        elif self.price_cents <= 2500:
+            price_category = "Mid-range"
         else:
-            return "Premium"
-
-    @computed_field
-    @property
-    def dietary_info(self) -> List[str]:
+            price_category = "Premium"
         info = []
         if self.is_vegetarian:
             info.append("Vegetarian")
         if self.is_spicy:
             info.append("Spicy")
-        return info
+        # the model is frozen, so bypass the assignment guard for derived fields
+        object.__setattr__(self, 'price', f"{self.price_cents / 100:.2f}")
+        object.__setattr__(self, 'price_category', price_category)
+        object.__setattr__(self, 'dietary_info', info)
+        return self
+
+    @classmethod
+    def from_base(cls, item_id: int, item: FoodItemBase) -> 'FoodItem':
+        # item has already been validated as FoodItemBase, so skip re-validation
+        return cls.model_construct(id=item_id, **item.__dict__).set_display_fields()
 
 
 class OrderStatus(str, Enum):
@@ -88,11 +105,11 @@ class OrderItem(BaseModel):
     menu_item_id: int = Field(..., gt=0)
     menu_item_name: str = Field(..., min_length=1, max_length=100)
     quantity: int = Field(..., gt=0, le=10)
-    unit_price: Decimal = Field(..., gt=0, max_digits=6, decimal_places=2)
+    unit_price_cents: int = Field(..., gt=0, le=999999)
 
     @property
-    def item_total(self) -> Decimal:
-        return self.unit_price * self.quantity
+    def item_total_cents(self) -> int:
+        return self.unit_price_cents * self.quantity
 
 class Customer(BaseModel):
     name: str = Field(..., min_length=3, max_length=100, description="Name of the customer")
@@ -102,94 +119,118 @@ class Customer(BaseModel):
 class Order(BaseModel):
     customer: Customer = Field(..., description="Customer details")
     items: List[OrderItem] = Field(..., min_items=1, description="Items in the order")
-    total_price: Decimal = Field(..., gt=0, max_digits=6, decimal_places=2, description="Total price of the order")
     status: OrderStatus = Field(..., description="Status of the order")
     created_at: datetime = Field(..., default_factory=datetime.now, description="Date and time the order was created")
     updated_at: datetime = Field(..., default_factory=datetime.now, description="Date and time the order was last updated")
 
+    @computed_field
     @property
-    def total_price(self) -> Decimal:
-        return sum(item.item_total for item in self.items)
-    
-    @property
-    def order_total(self) -> Decimal:
-        return sum(item.item_total for item in self.items)
+    def total_price_cents(self) -> int:
+        return sum(item.item_total_cents for item in self.items)
 
+    @computed_field
     @property
-    def order_status(self) -> OrderStatus:
-        return self.status
+    def total_price(self) -> str:
+        return f"{self.total_price_cents / 100:.2f}"
 
 # ////////////////////////////////////////////
 
 app = FastAPI(title="Restaurant Food Ordering System", description="API for managing restaurant menu and orders", version="1.0.0")
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=4)
+# Handlers never await while touching these stores, so each write runs to
+# completion on the event loop without locking. Keep it that way, or add a
+# lock, if a handler ever needs to await in the middle of an update.
 menu_db: dict[int, FoodItem] = {}
 orders_db: dict[int, Order] = {}
+by_category: dict[FoodCategory, set[int]] = defaultdict(set)
+menu_cache: dict[int, bytes] = {}
+menu_order: list[int] = []
+menu_positions: dict[int, int] = {}
 id_generator = count(1)
 
 # api endpoints
 
 @app.get("/menu", response_model=List[FoodItem])
-def get_menu():
-    data = list(menu_db.values())
-    return JSONResponse(content=data, status_code=200)
+async def get_menu(limit: int = Query(50, ge=1, le=100), offset: int = Query(0, ge=0)):
+    page = b'[' + b','.join(menu_cache[i] for i in menu_order[offset:offset + limit]) + b']'
+    return Response(content=page, media_type='application/json')
 
 @app.get("/menu/{item_id}", response_model=FoodItem)
-def get_item(item_id: int = Path(..., ge=1)):
+async def get_item(item_id: int = Path(..., ge=1)):
     if item_id not in menu_db:
         raise HTTPException(status_code=404, detail="Item not found")
-    return JSONResponse(content=menu_db[item_id].model_dump(), status_code=200)
+    return Response(content=menu_cache[item_id], media_type='application/json')
 
-@app.post("/menu", response_model=FoodItem)
-def add_item(item: FoodItemBase):
+@app.post("/menu", response_model=FoodItem, status_code=201)
+async def add_item(item: FoodItemBase):
     new_id = next(id_generator)
-    new_item = FoodItem(id=new_id, **item.model_dump())
+    new_item = FoodItem.from_base(new_id, item)
     menu_db[new_id] = new_item
-    return JSONResponse(content=new_item.model_dump(), status_code=201)
+    by_category[new_item.category].add(new_id)
+    menu_cache[new_id] = orjson.dumps(new_item.model_dump(mode='json'))
+    menu_positions[new_id] = len(menu_order)
+    menu_order.append(new_id)
+    return Response(content=menu_cache[new_id], status_code=201, media_type='application/json')
 
 @app.put("/menu/{item_id}", response_model=FoodItem)
-def update_item(item_id: int = Path(..., ge=1), item: FoodItemBase = None):
+async def update_item(item: FoodItemBase, item_id: int = Path(..., ge=1)):
     if item_id not in menu_db:
         raise HTTPException(status_code=404, detail="Item not found")
-    updated_item = FoodItem(id=item_id, **item.model_dump())
+    updated_item = FoodItem.from_base(item_id, item)
+    by_category[menu_db[item_id].category].discard(item_id)
     menu_db[item_id] = updated_item
-    return JSONResponse(content=updated_item.model_dump(), status_code=200)
+    by_category[updated_item.category].add(item_id)
+    menu_cache[item_id] = orjson.dumps(updated_item.model_dump(mode='json'))
+    return Response(content=menu_cache[item_id], media_type='application/json')
 
 @app.delete("/menu/{item_id}")
-def delete_item(item_id: int = Path(..., ge=1)):
+async def delete_item(item_id: int = Path(..., ge=1)):
     if item_id not in menu_db:
         raise HTTPException(status_code=404, detail="Item not found")
+    by_category[menu_db[item_id].category].discard(item_id)
     del menu_db[item_id]
-    return JSONResponse(content={"message": "Item deleted"}, status_code=200)
+    menu_cache.pop(item_id, None)
+    # swap the last id into the freed slot so removal stays O(1)
+    pos = menu_positions.pop(item_id)
+    last_id = menu_order.pop()
+    if last_id != item_id:
+        menu_order[pos] = last_id
+        menu_positions[last_id] = pos
+    return {"message": "Item deleted"}
 
 @app.get("/menu/category/{category}", response_model=List[FoodItem])
-def get_by_category(category: FoodCategory):
-    items = [item for item in menu_db.values() if item.category == category]
-    return JSONResponse(content=items, status_code=200)
+async def get_by_category(category: FoodCategory):
+    item_ids = sorted(by_category.get(category, ()), key=menu_positions.__getitem__)
+    page = b'[' + b','.join(menu_cache[i] for i in item_ids) + b']'
+    return Response(content=page, media_type='application/json')
 
-@app.post("/orders", response_model=Order)
-def create_order(order: Order):
+@app.post("/orders", response_model=Order, status_code=201)
+async def create_order(order: Order):
     new_id = next(id_generator)
-    new_order = Order(id=new_id, **order.model_dump())
-    orders_db[new_id] = new_order
-    return JSONResponse(content=new_order.model_dump(), status_code=201)
+    response = Response(content=orjson.dumps(order.model_dump(mode='json')), status_code=201, media_type='application/json')
+    orders_db[new_id] = order
+    return response
 
 @app.get("/orders", response_model=List[Order])
-def get_orders():
-    return JSONResponse(content=list(orders_db.values()), status_code=200)
+async def get_orders():
+    return Response(content=orjson.dumps([order.model_dump(mode='json') for order in orders_db.values()]), media_type='application/json')
 
 @app.get("/orders/{order_id}", response_model=Order)
-def get_order(order_id: int = Path(..., ge=1)):
+async def get_order(order_id: int = Path(..., ge=1)):
     if order_id not in orders_db:
         raise HTTPException(status_code=404, detail="Order not found")
-    return JSONResponse(content=orders_db[order_id].model_dump(), status_code=200)
+    return Response(content=orjson.dumps(orders_db[order_id].model_dump(mode='json')), media_type='application/json')
 
 @app.put("/orders/{order_id}", response_model=Order)
-def update_order(order_id: int = Path(..., ge=1), order: Order = None):
+async def update_order(order: Order, order_id: int = Path(..., ge=1)):
     if order_id not in orders_db:
         raise HTTPException(status_code=404, detail="Order not found")
-    updated_order = Order(id=order_id, **order.model_dump())
-    orders_db[order_id] = updated_order
-    return JSONResponse(content=updated_order.model_dump(), status_code=200)
+    response = Response(content=orjson.dumps(order.model_dump(mode='json')), media_type='application/json')
+    orders_db[order_id] = order
+    return response
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Each worker process keeps its own in-memory stores, so only raise
+    # WEB_CONCURRENCY above 1 (e.g. to os.cpu_count()) for read-only load tests.
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=workers)